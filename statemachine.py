@@ -15,7 +15,7 @@ __email__       = "tsukumo.da@gmail.com"
 __status__      = "Development"
 
 import types
-import collections
+import collections.abc
 
 class StateMachine:
     """
@@ -138,7 +138,7 @@ class StateMachine:
                 self._die('transitions must be dictionaries')
             if not type(transition.get('from')) is str:
                 self._die('transitions from must be a string')
-            if not isinstance(transition.get('on'), collections.Iterable):
+            if not isinstance(transition.get('on'), collections.abc.Iterable):
                 self._die('transitions on must be iterable')
             if transition.get('to') != None:
                 if not type(transition.get('to')) is str:
@@ -176,6 +176,14 @@ class StateMachine:
         self._current = self._get(['initial'])
 
 
+    def current(self):
+        """
+        @brief Gets the current state of the state machine.
+        """
+
+        return self._current
+
+
     def step(self, item):
         """
         @brief Moves the state machine forward by one step.
@@ -17,6 +17,9 @@ __status__      = "Development"
 
 # python language imports
 import os
+import re
+import codecs
+import unicodedata
 
 class tcaps:
     """
@@ -206,6 +209,16 @@ class tcaps:
         return self._escape + '2J'
 
 
+    def clear_line(self):
+        """
+        @brief Clears from the cursor to the end of the line
+
+        @return the string needed to clear the rest of the line
+        """
+        # Return the erase line ANSI sequence of K
+        return self._escape + 'K'
+
+
     def move_cursor(self, x, y):
         """
         @brief Moves the cursor to the given x,y
@@ -234,3 +247,334 @@ class tcaps:
         """
         # Return the clear and blank cursor ANSI sequences of 2j and ;H
         return self._escape + '2J' + self._escape + ';H'
+
+
+class tstrip:
+    """
+    @brief tstrip removes termcaps escape sequences from a stream and
+           measures the visible width of each line.
+
+    Input may be fed chunk by chunk as bytes (read from a file object or
+    an mmap) or as strings. Escape sequences and multi-byte characters
+    split across chunk boundaries are carried over to the next chunk.
+    """
+
+
+    # 'private' members
+
+    # Defines the escape character which starts every termcap
+    _escape = '\033'
+
+
+    # Matches the parameter and intermediate characters of a CSI sequence
+    _csi_body = re.compile('[\x20-\x3f]*')
+
+
+    # Matches a whole escape sequence as consumed by the stream parser
+    _sequence = re.compile('\033(?:\\[[\x20-\x3f]*[\x40-\x7e]?|[\x40-\x5f]?)')
+
+
+    # Matches anything which is not printable ascii, where the width of
+    # a character can no longer be assumed to be one
+    _special = re.compile('[^\x20-\x7e]')
+
+
+    # Defines the escape sequence left open by the previous chunk,
+    # one of None, 'esc' or 'csi'
+    _state = None
+
+
+    # Defines the visible width of the current unterminated line
+    _width = 0
+
+
+    # Defines whether anything followed the last newline
+    _open = False
+
+
+    # Defines the number of cells between tab stops
+    _tabs = 8
+
+
+    # 'private' functions
+
+    def _char_width(self, char):
+        """
+        @brief Finds the number of terminal cells a character occupies.
+
+        @param[in] char Single character to measure.
+
+        @return 0 for control and combining characters, 2 for wide
+                characters and 1 otherwise
+        """
+
+        width = self._cache.get(char)
+        if width != None:
+            return width
+
+        code = ord(char)
+        if code < 0x20 or 0x7f <= code < 0xa0:
+            width = 0
+        elif unicodedata.combining(char) or \
+             unicodedata.category(char) in ('Mn', 'Me', 'Cf'):
+            width = 0
+        elif unicodedata.east_asian_width(char) in ('W', 'F'):
+            width = 2
+        else:
+            width = 1
+
+        self._cache[char] = width
+        return width
+
+
+    def _measure(self, text, start, end, column=0):
+        """
+        @brief Measures text[start:end] without copying it.
+
+        @param[in] column Cell the range starts at, needed for tab stops.
+
+        @return the cell the range ends at
+        """
+
+        while True:
+            # Printable ascii runs count one cell per character
+            match = self._special.search(text, start, end)
+            if match == None:
+                return column + end - start
+            index = match.start()
+            column += index - start
+            if text[index] == '\t':
+                column += self._tabs - column % self._tabs
+            else:
+                column += self._char_width(text[index])
+            start = index + 1
+
+
+    def _visible(self, text, start, end, out):
+        """
+        @brief Emits text[start:end] and accounts its width per line.
+        """
+
+        if start >= end:
+            return
+
+        out.append(text[start:end])
+
+        # Close a line for every newline inside the range
+        newline = text.find('\n', start, end)
+        while newline >= 0:
+            self._widths.append(self._measure(text, start, newline, self._width))
+            self._width = 0
+            self._open = False
+            start = newline + 1
+            newline = text.find('\n', start, end)
+
+        if start < end:
+            self._width = self._measure(text, start, end, self._width)
+            self._open = True
+
+
+    def _skip(self, text, pos):
+        """
+        @brief Consumes the open escape sequence starting at pos.
+
+        @return the position after the sequence, or the end of text if
+                the sequence continues into the next chunk
+        """
+
+        end = len(text)
+
+        if self._state == 'esc':
+            if pos == end:
+                return end
+            if text[pos] == '[':
+                self._state = 'csi'
+                pos += 1
+            else:
+                self._state = None
+                # Two character escapes (ESC followed by @ to _) are dropped whole
+                if '\x40' <= text[pos] <= '\x5f':
+                    pos += 1
+                return pos
+
+        if self._state == 'csi':
+            pos = self._csi_body.match(text, pos).end()
+            if pos == end:
+                return end
+            self._state = None
+            # Only consume a valid final character, such as m, J or H
+            if '\x40' <= text[pos] <= '\x7e':
+                pos += 1
+
+        return pos
+
+
+    # 'public' functions
+
+    def __init__(self, encoding='utf-8', tabs=8):
+        """
+        @brief Creates a tstrip environment for a single stream.
+
+        @param[in] encoding Encoding used to decode bytes chunks.
+        @param[in] tabs     Number of cells between tab stops.
+        """
+
+        self._decoder = codecs.getincrementaldecoder(encoding)('replace')
+        self._cache = { }
+        self._widths = [ ]
+        self._state = None
+        self._width = 0
+        self._open = False
+        self._tabs = tabs
+
+
+    def feed(self, chunk):
+        """
+        @brief Strips the escape sequences from the next chunk.
+
+        @param[in] chunk Bytes or string following the previous chunk.
+
+        @return the visible text of the chunk
+        """
+
+        if not isinstance(chunk, str):
+            chunk = self._decoder.decode(chunk)
+
+        out = [ ]
+        end = len(chunk)
+
+        # Finish any sequence left open by the previous chunk
+        pos = self._skip(chunk, 0)
+
+        while pos < end:
+            index = chunk.find(self._escape, pos)
+            if index < 0:
+                self._visible(chunk, pos, end, out)
+                break
+            self._visible(chunk, pos, index, out)
+            self._state = 'esc'
+            self._open = True
+            pos = self._skip(chunk, index + 1)
+
+        return ''.join(out)
+
+
+    def flush(self):
+        """
+        @brief Ends the stream, closing the last unterminated line.
+
+        @return the visible text still held by the decoder
+        """
+
+        text = self.feed(self._decoder.decode(b'', True))
+
+        # Escapes or zero width text still make up a line of their own
+        if self._open:
+            self._widths.append(self._width)
+
+        self._state = None
+        self._width = 0
+        self._open = False
+        return text
+
+
+    def widths(self):
+        """
+        @brief Takes the widths of the lines completed so far.
+
+        @return a list of visible line widths, emptied on every call
+        """
+
+        widths = self._widths
+        self._widths = [ ]
+        return widths
+
+
+    def stream(self, source, size=65536):
+        """
+        @brief Strips a whole file object or mmap chunk by chunk.
+
+        @param[in] source Object with a read method, such as a file or mmap.
+        @param[in] size   Number of bytes to read per chunk.
+
+        @return a generator of (text, widths) tuples, one per chunk
+        """
+
+        while True:
+            chunk = source.read(size)
+            if not chunk:
+                break
+            yield self.feed(chunk), self.widths()
+
+        yield self.flush(), self.widths()
+
+
+    def strip(self, text):
+        """
+        @brief Strips a single complete string independently of the stream.
+
+        No decoder or stream state is involved, so this is cheap enough to
+        call once per cell or line.
+
+        @param[in] text String which may contain escape sequences.
+
+        @return the visible text
+        """
+
+        if not self._escape in text:
+            return text
+
+        return self._sequence.sub('', text)
+
+
+    def truncate(self, text, width):
+        """
+        @brief Cuts a single line to a width, keeping its escape sequences.
+
+        Only visible characters are counted, escape sequences before the
+        cut are kept so the text keeps its style up to the cut.
+
+        @param[in] text  String which may contain escape sequences.
+        @param[in] width Maximum number of terminal cells to keep.
+
+        @return a tuple of the text occupying at most width cells and the
+                width it occupies
+        """
+
+        size = 0
+        index = 0
+        end = len(text)
+        while index < end:
+            # Escape sequences occupy no cells and are kept whole
+            if text[index] == self._escape:
+                index = self._sequence.match(text, index).end()
+                continue
+            after = self._measure(text, index, index + 1, size)
+            if after > width:
+                return text[:index], size
+            size = after
+            index += 1
+
+        return text, size
+
+
+    def measure(self, text):
+        """
+        @brief Measures a single string independently of the stream.
+
+        @param[in] text String which may contain escape sequences.
+
+        @return the visible width of the widest line in text
+        """
+
+        text = self.strip(text)
+
+        width = 0
+        start = 0
+        newline = text.find('\n')
+        while newline >= 0:
+            width = max(width, self._measure(text, start, newline))
+            start = newline + 1
+            newline = text.find('\n', start)
+
+        return max(width, self._measure(text, start, len(text)))
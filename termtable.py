@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Provides styled table printing functionality.
+"""
+
+__author__      = "Tsukumo"
+__copyright__   = "Copyright 2014, Tsukumo"
+__credits__     = [ ]
+__license__     = "MIT"
+__version__     = "0.0.1"
+__maintainer__  = "Tsukumo"
+__email__       = "tsukumo.da@gmail.com"
+__status__      = "Development"
+
+
+# python language imports
+import sys
+import itertools
+
+# project imports
+from termcaps import tcaps, tstrip
+
+class ttable:
+    """
+    @brief ttable prints rows from an iterator as styled columns.
+
+    Columns are defined by a list of dictionaries following this pattern:
+
+        {
+            'title': 'name',   #< optional header text
+            'width': 10,       #< optional, sized from a sample if missing
+            'truncate': True,  #< cut wider cells, defaults to True only
+                               #  when the width is fixed
+            'align': 'left',   #< 'left' or 'right', defaults to 'left'
+            'fg'   : 'red',    #< optional tcaps style of the column
+            'bg'   : 'black',
+            'attr' : 'bold'
+        }
+
+    Row styles are dictionaries of 'fg', 'bg' and 'attr' which are cycled
+    over the rows, for example [ { }, { 'bg': 'blue' } ] for stripes.
+    """
+
+
+    # 'private' members
+
+    # Defines the columns, their widths once sized and whether wider
+    # cells are cut or overflow their column
+    _columns = [ ]
+
+    _widths = [ ]
+
+    _cuts = [ ]
+
+
+    # Defines the tcaps environment used for all styles
+    _tcaps = None
+
+
+    # Defines the tstrip environment used to measure cells
+    _tstrip = None
+
+
+    # 'private' functions
+
+    def _die(self, msg):
+        raise Exception('ttable: ' + msg)
+
+
+    def _sequence(self, style):
+        """
+        @brief Builds the start sequence of a style once.
+
+        @return the termcap starting the style, or nothing for no style
+        """
+
+        if not style or (style.get('fg') == None and
+                         style.get('bg') == None and
+                         style.get('attr') == None):
+            return ''
+
+        return self._tcaps.start(style.get('fg'), style.get('bg'), style.get('attr'))
+
+
+    def _styles(self, row):
+        """
+        @brief Caches the sequences of every column for a row style.
+
+        @return a tuple of (cell starts, cell ends, separator)
+        """
+
+        row_start = self._sequence(row)
+        starts = [ ]
+        ends = [ ]
+
+        for column in self._columns:
+            start = row_start + self._sequence(column)
+            starts.append(start)
+            ends.append(self._tcaps.default() if start else '')
+
+        # The separator keeps the row style so backgrounds are unbroken
+        separator = self._separator
+        if row_start:
+            separator = row_start + separator + self._tcaps.default()
+
+        return starts, ends, separator
+
+
+    def _width(self, text):
+        """
+        @brief Measures the visible width of a cell.
+        """
+
+        # Printable ascii occupies one cell per character
+        if text.isascii() and text.isprintable():
+            return len(text)
+
+        return self._tstrip.measure(text)
+
+
+    def _line(self, cells, styles):
+        """
+        @brief Formats a single row into a line of output.
+        """
+
+        starts, ends, separator = styles
+        parts = [ ]
+
+        for index, column in enumerate(self._columns):
+            value = cells[index] if index < len(cells) else None
+            text = '' if value == None else str(value)
+
+            width = self._widths[index]
+            size = self._width(text)
+
+            # Cut cells which do not fit their column only when asked to,
+            # otherwise they overflow rather than silently losing data
+            if size > width and self._cuts[index]:
+                text, size = self._tstrip.truncate(text, width)
+                # The cut may drop the cell's own reset, so end its inline
+                # styles and restore the column style for the padding
+                if '\033' in text:
+                    text += self._tcaps.default() + starts[index]
+
+            pad = ' ' * (width - size)
+
+            if index:
+                parts.append(separator)
+            parts.append(starts[index])
+            if column.get('align') == 'right':
+                parts.append(pad)
+                parts.append(text)
+            else:
+                parts.append(text)
+                parts.append(pad)
+            parts.append(ends[index])
+
+        parts.append('\n')
+        return ''.join(parts)
+
+
+    # 'public' functions
+
+    def __init__(self, columns, rows=None, header=None, separator=' ',
+                 sample=100, buffer=65536, tc=None):
+        """
+        @brief Creates a ttable with the specified columns and styles.
+
+        @param[in] columns   List of column dictionaries.
+        @param[in] rows      List of row styles cycled over the rows.
+        @param[in] header    Style of the header row, printed when any
+                             column has a title.
+        @param[in] separator String printed between columns.
+        @param[in] sample    Number of rows measured to size columns
+                             without a width, later wider cells overflow
+                             unless the column sets truncate.
+        @param[in] buffer    Number of characters held before writing.
+        @param[in] tc        tcaps environment used for the styles.
+        """
+
+        if not type(columns) is list or not columns:
+            self._die('columns must be a non empty list')
+        for column in columns:
+            if not type(column) is dict:
+                self._die('columns must be dictionaries')
+
+        self._columns = columns
+        self._rows = rows or [ { } ]
+        self._header = header
+        self._separator = separator
+        self._sample = sample
+        self._buffer = buffer
+        self._tcaps = tc or tcaps(True)
+        self._tstrip = tstrip()
+
+
+    def render(self, rows, out=None):
+        """
+        @brief Prints every row of an iterator as it is produced.
+
+        Only the sample used to size columns is held in memory, the rest
+        of the rows are formatted one at a time and written in bulk.
+
+        @param[in] rows Iterable of rows, each an indexable of cells.
+        @param[in] out  File object to write to, defaults to stdout.
+        """
+
+        out = out or sys.stdout
+        rows = iter(rows)
+
+        # Size the columns without a width from the titles and a sample
+        titles = [ column.get('title') for column in self._columns ]
+        self._widths = [ column.get('width') for column in self._columns ]
+        self._cuts = [ column.get('truncate', column.get('width') != None)
+                       for column in self._columns ]
+
+        if None in self._widths:
+            sample = list(itertools.islice(rows, self._sample))
+            for index, width in enumerate(self._widths):
+                if width != None:
+                    continue
+                width = self._width(str(titles[index] or ''))
+                for cells in sample:
+                    if index < len(cells) and cells[index] != None:
+                        width = max(width, self._width(str(cells[index])))
+                self._widths[index] = width
+            rows = itertools.chain(sample, rows)
+
+        # Build every sequence once rather than once per cell
+        styles = [ self._styles(row) for row in self._rows ]
+
+        holder = [ ]
+        size = 0
+
+        if any(title != None for title in titles):
+            line = self._line(titles, self._styles(self._header))
+            holder.append(line)
+            size += len(line)
+
+        for index, cells in enumerate(rows):
+            line = self._line(cells, styles[index % len(styles)])
+            holder.append(line)
+            size += len(line)
+
+            # Write the held lines in a single call once the buffer is full
+            if size >= self._buffer:
+                out.write(''.join(holder))
+                holder = [ ]
+                size = 0
+
+        if holder:
+            out.write(''.join(holder))
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Provides terminal views driven by a StateMachine.
+"""
+
+__author__      = "Tsukumo"
+__copyright__   = "Copyright 2014, Tsukumo"
+__credits__     = [ ]
+__license__     = "MIT"
+__version__     = "0.0.1"
+__maintainer__  = "Tsukumo"
+__email__       = "tsukumo.da@gmail.com"
+__status__      = "Development"
+
+
+# python language imports
+import sys
+import types
+import codecs
+
+# project imports
+from statemachine import StateMachine
+from termcaps import tcaps
+
+class tview:
+    """
+    @brief tview redraws the render function of the current state of a
+           StateMachine once per batch of input events.
+
+    Render functions are bound to states in a dictionary:
+
+        {
+            'statename': renderfunction,
+            'statename': renderfunction,
+            etc..
+        }
+
+    A render function is called as render(state) and returns the screen
+    as a string or a list of lines. Every step of the machine, or a call
+    to touch, marks the view dirty, and only the lines which changed
+    since the last redraw are written, each addressed by moving the
+    cursor to it.
+    """
+
+
+    # 'private' members
+
+    # Defines the machine whose state is rendered
+    _machine = None
+
+
+    # Defines the lines on screen after the last redraw,
+    # None when the screen must be cleared first
+    _frame = None
+
+
+    # Defines whether the view was marked dirty by a step, touch or
+    # invalidate since the last redraw
+    _dirty = True
+
+
+    # 'private' functions
+
+    def _die(self, msg):
+        raise Exception('tview: ' + msg)
+
+
+    def _bind(self, settings):
+        """
+        @brief Copies the settings with an after callback marking the view dirty.
+
+        @return the settings to create the StateMachine with
+        """
+
+        if not type(settings) is dict:
+            return settings
+
+        settings = dict(settings)
+        callbacks = settings.get('callbacks')
+        if callbacks == None:
+            callbacks = { }
+        if not type(callbacks) is dict:
+            return settings
+
+        callbacks = dict(callbacks)
+        chained = callbacks.get('after')
+
+        # Leave anything which is not a function for the machine to reject
+        if chained != None and not isinstance(chained, types.FunctionType):
+            return settings
+
+        # A closure rather than a method so the machine accepts it
+        def after(fr, item, to):
+            if chained: chained(fr, item, to)
+            self._dirty = True
+
+        callbacks['after'] = after
+        settings['callbacks'] = callbacks
+        return settings
+
+
+    # 'public' functions
+
+    def __init__(self, settings, renders, out=None, tc=None, encoding='utf-8'):
+        """
+        @brief Creates a tview and the StateMachine it draws.
+
+        @param[in] settings StateMachine settings dictionary.
+        @param[in] renders  Dictionary of state names to render functions.
+        @param[in] out      File object to draw to, defaults to stdout.
+        @param[in] tc       tcaps environment used for cursor movement.
+        @param[in] encoding Encoding used to decode bytes input.
+        """
+
+        if not type(renders) is dict:
+            self._die('renders must be a dictionary')
+        for state in renders:
+            if not isinstance(renders[state], types.FunctionType):
+                self._die('all renders must be functions')
+
+        self._renders = renders
+        self._out = out or sys.stdout
+        self._tcaps = tc or tcaps(True)
+        self._decoder = codecs.getincrementaldecoder(encoding)('replace')
+        self._frame = None
+        self._dirty = True
+        self._machine = StateMachine(self._bind(settings))
+
+
+    def state(self):
+        """
+        @brief Gets the current state of the machine.
+        """
+
+        return self._machine.current()
+
+
+    def feed(self, events):
+        """
+        @brief Steps the machine through a batch of events, then redraws once.
+
+        A burst of typing or pasted input read in a single call, such as
+        os.read(fd, 4096), should be fed at once to cost a single redraw.
+        Bytes are decoded into characters first, carrying characters split
+        across reads over to the next call.
+
+        @param[in] events Iterable of events, such as a string of keys,
+                          or bytes read from the terminal.
+        """
+
+        if isinstance(events, (bytes, bytearray, memoryview)):
+            events = self._decoder.decode(events)
+
+        for event in events:
+            self._machine.step(event)
+
+        self.redraw()
+
+
+    def touch(self):
+        """
+        @brief Marks the view dirty so the next redraw rewrites changed lines.
+
+        Used when the rendered content changes without a step of the
+        machine, such as the value of a progress view.
+        """
+
+        self._dirty = True
+
+
+    def invalidate(self):
+        """
+        @brief Forces the next redraw to clear and draw the whole screen.
+        """
+
+        self._frame = None
+        self._dirty = True
+
+
+    def redraw(self):
+        """
+        @brief Draws the lines of the current state which changed.
+
+        Nothing is written unless the view was marked dirty by a step,
+        touch or invalidate since the last redraw.
+        """
+
+        if not self._dirty:
+            return
+        self._dirty = False
+
+        render = self._renders.get(self.state())
+        lines = render(self.state()) if render else [ ]
+        if isinstance(lines, str):
+            lines = lines.split('\n')
+
+        holder = [ ]
+        frame = self._frame
+        if frame == None:
+            holder.append(self._tcaps.reset_screen())
+            frame = [ ]
+
+        # Rewrite the changed lines, the sequence takes line;column from 1
+        for index, line in enumerate(lines):
+            if index >= len(frame) or frame[index] != line:
+                holder.append(self._tcaps.move_cursor(index + 1, 1))
+                holder.append(self._tcaps.clear_line())
+                holder.append(line)
+
+        # Blank the lines left over from a longer previous frame
+        for index in range(len(lines), len(frame)):
+            holder.append(self._tcaps.move_cursor(index + 1, 1))
+            holder.append(self._tcaps.clear_line())
+
+        self._frame = list(lines)
+
+        if holder:
+            self._out.write(''.join(holder))
+            if hasattr(self._out, 'flush'):
+                self._out.flush()
@@ -206,3 +206,9 @@ def test_weak_wildcard():
     })
     machine.step(1)
     assert(machine._current == 'b')
+
+def test_current():
+    machine = get_machine()
+    assert(machine.current() == 'a')
+    machine.step(1)
+    assert(machine.current() == 'b')
@@ -1,7 +1,10 @@
 import sys, os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
+import io
+
 from termcaps import tcaps as Tcaps
+from termcaps import tstrip as Tstrip
 
 tcaps = Tcaps(True)
 
@@ -27,3 +30,59 @@ def test_reset_screen():
 
 def test_reset_cursor():
     print(tcaps.reset_cursor())
+
+styled = tcaps.reset_screen() + tcaps.move_cursor(3,4) + \
+    tcaps.start("red","yellow","reverse") + "oooo" + tcaps.default() + "oo\n" + \
+    tcaps.start("blue") + "中文" + tcaps.end(fg=True) + "é\n"
+
+def test_strip():
+    strip = Tstrip()
+    assert(strip.feed(styled) == "oooooo\n中文é\n")
+    assert(strip.widths() == [6, 5])
+    assert(strip.widths() == [ ])
+
+def test_strip_split_chunks():
+    data = styled.encode('utf-8')
+    for size in range(1, 8):
+        strip = Tstrip()
+        text = ''.join(chunk for chunk, widths in
+                       strip.stream(io.BytesIO(data), size))
+        assert(text == "oooooo\n中文é\n")
+
+def test_strip_stream_widths():
+    strip = Tstrip()
+    widths = [ ]
+    for chunk, chunk_widths in strip.stream(io.BytesIO(
+            (styled + "tail" + tcaps.default()).encode('utf-8')), 3):
+        widths += chunk_widths
+    assert(widths == [6, 5, 4])
+
+def test_measure():
+    strip = Tstrip()
+    assert(strip.measure(tcaps.start("red") + "ab" + tcaps.default()) == 2)
+    assert(strip.measure("ab\n中文字") == 6)
+    assert(strip.measure("") == 0)
+
+def test_strip_tabs():
+    strip = Tstrip()
+    strip.feed("a\tb\n\t\n12345678\tx\n中\tx\n")
+    assert(strip.widths() == [9, 8, 17, 9])
+
+    strip = Tstrip(tabs=4)
+    strip.feed(tcaps.start("red") + "ab" + tcaps.default() + "\tc\n")
+    assert(strip.widths() == [5])
+    assert(strip.measure("a\tb") == 5)
+
+def test_strip_trailing_line():
+    strip = Tstrip()
+    strip.feed("ab\n" + tcaps.default())
+    strip.flush()
+    assert(strip.widths() == [2, 0])
+
+    strip.feed("ab\n" + tcaps.default() + "\n")
+    strip.flush()
+    assert(strip.widths() == [2, 0])
+
+    strip.feed("ab\n")
+    strip.flush()
+    assert(strip.widths() == [2])
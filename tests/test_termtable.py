@@ -0,0 +1,92 @@
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import io
+
+from termcaps import tcaps as Tcaps
+from termtable import ttable as Ttable
+
+tcaps = Tcaps(True)
+
+def test_verify_columns():
+    try:
+        table = Ttable([ ])
+        assert(False)
+    except Exception as inst:
+        assert(str(inst) == 'ttable: columns must be a non empty list')
+
+    try:
+        table = Ttable([ 'column' ])
+        assert(False)
+    except Exception as inst:
+        assert(str(inst) == 'ttable: columns must be dictionaries')
+
+def test_render_sampled_widths():
+    out = io.StringIO()
+    table = Ttable([ { 'title': 'name' }, { 'title': 'n', 'align': 'right' } ],
+                   tc=Tcaps(False))
+    table.render(iter([ ('a', 1), ('bbbbbb', 22), ('中文', None) ]), out)
+    assert(out.getvalue() == 'name    n\n'
+                             'a       1\n'
+                             'bbbbbb 22\n'
+                             '中文     \n')
+
+def test_render_fixed_widths_truncate():
+    out = io.StringIO()
+    table = Ttable([ { 'width': 3 }, { 'width': 2 } ], separator='|',
+                   tc=Tcaps(False))
+    table.render(iter([ ('abcdef', '中文'), ('a',) ]), out)
+    assert(out.getvalue() == 'abc|中\n'
+                             'a  |  \n')
+
+def test_render_styles():
+    out = io.StringIO()
+    table = Ttable([ { 'width': 2, 'fg': 'red' }, { 'width': 2 } ],
+                   rows=[ { }, { 'bg': 'blue' } ], tc=tcaps)
+    table.render(iter([ ('a', 'b'), ('c', 'd') ]), out)
+    red = tcaps.start('red')
+    blue = tcaps.start(bg='blue')
+    end = tcaps.default()
+    assert(out.getvalue() == red + 'a ' + end + ' ' + 'b \n' +
+                             blue + red + 'c ' + end +
+                             blue + ' ' + end +
+                             blue + 'd ' + end + '\n')
+
+def test_render_buffered_writes():
+    class Counter(io.StringIO):
+        writes = 0
+        def write(self, text):
+            self.writes += 1
+            return io.StringIO.write(self, text)
+
+    out = Counter()
+    table = Ttable([ { 'width': 4 } ], buffer=50, tc=Tcaps(False))
+    table.render((('%04d' % index,) for index in range(100)), out)
+    assert(out.getvalue().split('\n')[:2] == [ '0000', '0001' ])
+    assert(out.writes == 10)
+
+def test_render_overflow_past_sample():
+    out = io.StringIO()
+    table = Ttable([ { 'title': 'n', 'align': 'right' }, { } ], sample=2,
+                   tc=Tcaps(False))
+    table.render([ (1, 'a'), (2, 'b'), (12345, 'c') ], out)
+    assert(out.getvalue() == 'n  \n'
+                             '1 a\n'
+                             '2 b\n'
+                             '12345 c\n')
+
+def test_render_truncate_sampled():
+    out = io.StringIO()
+    table = Ttable([ { 'truncate': True }, { } ], sample=1, tc=Tcaps(False))
+    table.render([ ('ab', 'a'), ('abcd', 'b') ], out)
+    assert(out.getvalue() == 'ab a\n'
+                             'ab b\n')
+
+def test_render_truncate_keeps_inline_styles():
+    out = io.StringIO()
+    table = Ttable([ { 'width': 3 }, { 'width': 1 } ], tc=tcaps)
+    red = tcaps.start('red')
+    end = tcaps.default()
+    table.render([ (red + 'abcdef' + end, 'x'), ('ab', 'y') ], out)
+    assert(out.getvalue() == red + 'abc' + end + ' x\n'
+                             'ab  y\n')
@@ -0,0 +1,156 @@
+import sys, os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import io
+
+from termcaps import tcaps as Tcaps
+from termview import tview as Tview
+
+tcaps = Tcaps(True)
+
+renders = [ ]
+afters = [ ]
+
+selected = [ 0 ]
+
+def menu_render(state):
+    renders.append(state)
+    return '\n'.join([ ('>' if index == selected[0] else ' ') + item
+                       for index, item in enumerate(['one', 'two', 'three']) ])
+
+def done_render(state):
+    renders.append(state)
+    return 'done'
+
+def move(f, o, t):
+    if o == 'j': selected[0] += 1
+    if o == 'k': selected[0] -= 1
+
+def after_callback(f, o, t):
+    afters.append(o)
+
+def get_view(out):
+    global renders, afters
+    renders = [ ]
+    afters = [ ]
+    selected[0] = 0
+    return Tview({
+        'initial'    : 'menu',
+        'transitions': [
+            { 'from': 'menu', 'on': ['\n'], 'to': 'done' },
+            { 'from': 'menu', 'on': ['j', 'k'] }
+        ],
+        'callbacks'  : {
+            'stay'   : { 'menu': move },
+            'after'  : after_callback
+        }
+    }, { 'menu': menu_render, 'done': done_render }, out, tcaps)
+
+def test_verify_renders():
+    try:
+        view = Tview({ 'initial': 'a', 'transitions': [ ] }, None)
+        assert(False)
+    except Exception as inst:
+        assert(str(inst) == 'tview: renders must be a dictionary')
+
+    try:
+        view = Tview({ 'initial': 'a', 'transitions': [ ] }, { 'a': 3 })
+        assert(False)
+    except Exception as inst:
+        assert(str(inst) == 'tview: all renders must be functions')
+
+def test_first_redraw_clears():
+    out = io.StringIO()
+    view = get_view(out)
+    view.redraw()
+    assert(out.getvalue() == tcaps.reset_screen() +
+        tcaps.move_cursor(1,1) + tcaps.clear_line() + '>one' +
+        tcaps.move_cursor(2,1) + tcaps.clear_line() + ' two' +
+        tcaps.move_cursor(3,1) + tcaps.clear_line() + ' three')
+
+def test_batch_redraws_once():
+    out = io.StringIO()
+    view = get_view(out)
+    view.redraw()
+    out.seek(0); out.truncate()
+
+    view.feed('jjk')
+    assert(afters == ['j', 'j', 'k'])
+    assert(renders == ['menu', 'menu'])
+    # Only the lines which changed are rewritten
+    assert(out.getvalue() ==
+        tcaps.move_cursor(1,1) + tcaps.clear_line() + ' one' +
+        tcaps.move_cursor(2,1) + tcaps.clear_line() + '>two')
+
+def test_no_redraw_without_steps():
+    out = io.StringIO()
+    view = get_view(out)
+    view.redraw()
+    out.seek(0); out.truncate()
+
+    view.feed('x')
+    view.redraw()
+    assert(renders == ['menu'])
+    assert(out.getvalue() == '')
+
+def test_shorter_frame_blanks_lines():
+    out = io.StringIO()
+    view = get_view(out)
+    view.redraw()
+    out.seek(0); out.truncate()
+
+    view.feed('\n')
+    assert(view.state() == 'done')
+    assert(out.getvalue() ==
+        tcaps.move_cursor(1,1) + tcaps.clear_line() + 'done' +
+        tcaps.move_cursor(2,1) + tcaps.clear_line() +
+        tcaps.move_cursor(3,1) + tcaps.clear_line())
+
+def test_invalidate():
+    out = io.StringIO()
+    view = get_view(out)
+    view.redraw()
+    view.invalidate()
+    view.redraw()
+    assert(out.getvalue().count(tcaps.reset_screen()) == 2)
+
+def test_verify_after_callback():
+    try:
+        view = Tview({ 'initial': 'a', 'transitions': [ ],
+            'callbacks': { 'after': 5 }
+        }, { })
+        assert(False)
+    except Exception as inst:
+        assert(str(inst) == 'StateMachine: callback items must be dictionaries or functions')
+
+def test_touch_rewrites_changed_lines():
+    out = io.StringIO()
+    view = get_view(out)
+    view.redraw()
+    out.seek(0); out.truncate()
+
+    # Nothing is rewritten until the view is touched
+    selected[0] = 2
+    view.redraw()
+    assert(out.getvalue() == '')
+
+    view.touch()
+    view.redraw()
+    assert(renders == ['menu', 'menu'])
+    assert(out.getvalue() ==
+        tcaps.move_cursor(1,1) + tcaps.clear_line() + ' one' +
+        tcaps.move_cursor(3,1) + tcaps.clear_line() + '>three')
+
+def test_feed_bytes():
+    out = io.StringIO()
+    view = get_view(out)
+    view.feed(b'jj')
+    assert(afters == ['j', 'j'])
+    assert(selected[0] == 2)
+
+    # Multi-byte characters split across reads are carried over
+    view.feed('é'.encode('utf-8')[:1])
+    assert(afters == ['j', 'j'])
+    view.feed('é'.encode('utf-8')[1:] + b'\n')
+    assert(afters == ['j', 'j', '\n'])
+    assert(view.state() == 'done')